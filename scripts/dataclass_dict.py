@@ -4,7 +4,6 @@ from typing import Any, Dict, Optional, Type
 
 from dataclasses_json import dataclass_json
 from hydra_zen import builds, instantiate
-from sklearn.linear_model import LogisticRegression
 
 from flytezen.configuration import create_dataclass_from_callable_json
 from flytezen.logging import configure_logging
@@ -19,20 +18,22 @@ logistic_regression_custom_types: Dict[str, Type[Optional[Any]]] = {
     "l1_ratio": Optional[float],
 }
 
-LogisticRegressionInterface = dataclass_json(
-    dataclass(
-        create_dataclass_from_callable_json(
-            LogisticRegression, logistic_regression_custom_types
-        )
-    )
-)
-
 
 def pformat_log(x):
     return logger.info(f"{pformat(x)}\n")
 
 
 if __name__ == "__main__":
+    from sklearn.linear_model import LogisticRegression
+
+    LogisticRegressionInterface = dataclass_json(
+        dataclass(
+            create_dataclass_from_callable_json(
+                LogisticRegression, logistic_regression_custom_types
+            )
+        )
+    )
+
     logger.info("I(B(LogisticRegressionInterface):\n")
     pformat_log(instantiate(builds(LogisticRegressionInterface)))
     logger.info("Dict\\[str, DataClass]:\n")
@@ -1,5 +1,6 @@
-from flytezen.cli.execute import main as execute_main
-
-
 def main():
+    # import on first use so that importing flytezen.cli does not load
+    # flytekit and hydra
+    from flytezen.cli.execute import main as execute_main
+
     execute_main()
@@ -1,24 +1,15 @@
-import importlib
+import functools
+import logging
+import math
 import os
 import pathlib
 import sys
 import tempfile
 from dataclasses import dataclass, field
+from typing import Mapping, Optional
 
-import pyperclip
-import rich.syntax
-import rich.tree
-from dataclasses_json import dataclass_json
-from dotenv import load_dotenv
-from flytekit.configuration import Config as FlyteConfig
-from flytekit.configuration import (
-    FastSerializationSettings,
-    ImageConfig,
-    SerializationSettings,
-)
 from flytekit.core.base_task import PythonTask
 from flytekit.core.workflow import WorkflowBase
-from flytekit.remote import FlyteRemote
 from hydra_zen import ZenStore, make_config, make_custom_builds_fn, to_yaml, zen
 from omegaconf import DictConfig
 
@@ -38,6 +29,7 @@ from flytezen.cli.execution_utils import (
     generate_entity_configs,
     generate_hydra_config,
     git_info_to_workflow_version,
+    load_entity,
     random_alphanumeric_suffix,
     wait_for_workflow_completion,
 )
@@ -51,7 +43,6 @@ logger = configure_logging("flytezen.cli.execute")
 builds = make_custom_builds_fn(populate_full_signature=True)
 
 
-@dataclass_json
 @dataclass
 class ExecutionContext:
     """
@@ -70,30 +61,93 @@ class ExecutionContext:
         (DEV) or commit hash (PROD).
         version (str): A string representing the version of the workflow,
         typically including a commit hash or other identifiers.
+        poll_interval (float | None): Initial interval in seconds between
+        status checks while waiting for the execution to complete.
+        poll_backoff (float): Factor by which the polling interval grows
+        after each status check.
+        poll_max (float | None): Maximum interval in seconds between status
+        checks. Unset intervals fall back to the `FLYTE_POLL_INITIAL_SEC`
+        and `FLYTE_POLL_MAX_SEC` environment variables.
+
+    Raises:
+        ValueError: If a polling interval is not a finite positive number or
+        the backoff factor is smaller than 1, which would poll flyteadmin in
+        a busy loop.
     """
 
     mode: ExecutionMode = field(default_factory=ExecutionMode)
     image: str = "ghcr.io/sciexp/flytezen"
     tag: str = "main"
-    version: str = f"flytezen-main-{random_alphanumeric_suffix()}"
+    version: str = field(
+        default_factory=lambda: f"flytezen-main-{random_alphanumeric_suffix()}"
+    )
     package_path: str = "src"
     import_path: str = "flytezen.workflows"
     project: str = "flytesnacks"
     domain: str = "development"
     wait: bool = True
+    poll_interval: Optional[float] = None
+    poll_backoff: float = 1.5
+    poll_max: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        for name in ("poll_interval", "poll_max"):
+            value = getattr(self, name)
+            if value is not None and not (math.isfinite(value) and value > 0):
+                value_error_message = (
+                    f"{name} must be a positive number of seconds, got {value}"
+                )
+                raise ValueError(value_error_message)
+        if not (math.isfinite(self.poll_backoff) and self.poll_backoff >= 1):
+            value_error_message = (
+                f"poll_backoff must be at least 1, got {self.poll_backoff}"
+            )
+            raise ValueError(value_error_message)
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowEnv:
+    """
+    Workflow settings read from environment variables.
+
+    The environment is read once in `main`, after `.env` has been loaded, so
+    the remaining configuration code reads attributes instead of querying
+    `os.environ` repeatedly.
+
+    Attributes:
+        image (str | None): The container image set in `WORKFLOW_IMAGE`.
+        parent_module_path (str): The module whose submodules are inspected
+        for workflows, set in `WORKFLOW_PARENT_MODULE_PATH`.
+    """
+
+    image: Optional[str] = None
+    parent_module_path: str = "flytezen.workflows"
+
+    @classmethod
+    def from_environ(
+        cls, env: Optional[Mapping[str, str]] = None
+    ) -> "WorkflowEnv":
+        if env is None:
+            env = os.environ
+        return cls(
+            image=env.get("WORKFLOW_IMAGE"),
+            parent_module_path=env.get(
+                "WORKFLOW_PARENT_MODULE_PATH", "flytezen.workflows"
+            ),
+        )
 
 
 def handle_local_execution(exec_mode, execution_context, entity, entity_config):
-    if exec_mode.local_config.mode == LocalMode.shell:
+    if exec_mode.local_config.mode is LocalMode.shell:
         # https://github.com/flyteorg/flytekit/blob/dc9d26bfd29d7a3482d1d56d66a806e8fbcba036/flytekit/clis/sdk_in_container/run.py#L477
         output = entity(**entity_config.inputs)
-        logger.info(f"Output:\n\n{output}\n")
+        logger.info("Output:\n\n%s\n", output)
         return True
 
-    elif exec_mode.local_config.mode == LocalMode.cluster:
+    elif exec_mode.local_config.mode is LocalMode.cluster:
         config_file_path = (
             LOCAL_CLUSTER_CONFIG_FILE_PATH
-            if exec_mode.local_config.cluster_config.mode == ClusterMode.dev
+            if exec_mode.local_config.cluster_config.mode is ClusterMode.dev
             else REMOTE_CLUSTER_CONFIG_FILE_PATH
         )
         return handle_cluster_execution(
@@ -120,22 +174,88 @@ def handle_remote_execution(
     )
 
 
-def handle_cluster_execution(
-    cluster_mode, execution_context, entity, entity_config, config_file_path
-):
-    remote = FlyteRemote(
+@functools.lru_cache(maxsize=8)
+def get_remote(config_file_path: str, project: str, domain: str):
+    """
+    Returns a FlyteRemote for the given configuration file, project and domain.
+
+    The remote is cached so that executions in the same process, such as the
+    jobs of a hydra multirun sweep run by the default basic launcher, share
+    the configuration and the lazily initialized client channel instead of
+    rebuilding them for each execution.
+
+    Args:
+        config_file_path (str): Path to the flytectl configuration file.
+        project (str): Default project for the remote.
+        domain (str): Default domain for the remote.
+
+    Returns:
+        FlyteRemote: The cached remote.
+    """
+    # the remote client and configuration stack are only needed for cluster
+    # execution, so they are not imported for local shell execution or --help
+    from flytekit.configuration import Config as FlyteConfig
+    from flytekit.remote import FlyteRemote
+
+    return FlyteRemote(
         config=FlyteConfig.auto(config_file=config_file_path),
-        default_project=execution_context.project,
-        default_domain=execution_context.domain,
+        default_project=project,
+        default_domain=domain,
     )
-    logger.debug(f"Remote context:\n\n{remote.context}\n")
-    image_config = ImageConfig.from_images(
-        default_image=f"{execution_context.image}:{execution_context.tag}",
+
+
+@functools.lru_cache(maxsize=8)
+def get_image_config(image: str, tag: str):
+    """
+    Returns the image configuration for the given image and tag.
+
+    The default image is `image:tag`, and a `gpu` image is registered as
+    `image-gpu:tag`. The configuration is cached so that it is parsed only once
+    per image and tag.
+
+    Args:
+        image (str): Container image name including the registry path.
+        tag (str): Container image tag.
+
+    Returns:
+        ImageConfig: The cached image configuration.
+    """
+    from flytekit.configuration import ImageConfig
+
+    return ImageConfig.from_images(
+        default_image=f"{image}:{tag}",
         m={
-            "gpu": f"{execution_context.image}-gpu:{execution_context.tag}",
+            "gpu": f"{image}-gpu:{tag}",
         },
     )
 
+
+# execution location -> (handler, mode config attribute, valid modes)
+EXECUTION_HANDLERS = {
+    ExecutionLocation.local: (
+        handle_local_execution,
+        "local_config",
+        LocalMode,
+    ),
+    ExecutionLocation.remote: (
+        handle_remote_execution,
+        "remote_config",
+        ClusterMode,
+    ),
+}
+
+
+def handle_cluster_execution(
+    cluster_mode, execution_context, entity, entity_config, config_file_path
+):
+    remote = get_remote(
+        config_file_path, execution_context.project, execution_context.domain
+    )
+    logger.debug("Remote context:\n\n%s\n", remote.context)
+    image_config = get_image_config(
+        execution_context.image, execution_context.tag
+    )
+
     serialization_settings = get_serialization_settings(
         cluster_mode, execution_context, entity_config, remote, image_config
     )
@@ -145,18 +265,113 @@ def handle_cluster_execution(
     return True
 
 
+def fast_package_streaming(source: str, output_dir: str) -> pathlib.Path:
+    """
+    Packages `source` for fast registration like `FlyteRemote.fast_package`
+    without uploading it.
+
+    flytekit writes an uncompressed tar to a temporary file and then reads it
+    back into memory to gzip it. Here the tar stream is compressed as it is
+    written, which avoids the intermediate file and the in-memory copy. The
+    archive name, the ignore rules and the normalized file attributes match
+    flytekit's, so the digest-based archive name is unchanged.
+
+    Args:
+        source (str): The directory to package.
+        output_dir (str): The directory to write the archive to.
+
+    Returns:
+        pathlib.Path: Path to the gzipped tar archive.
+    """
+    import gzip
+    import tarfile
+
+    from flytekit.tools.fast_registration import (
+        FAST_FILEENDING,
+        FAST_PREFIX,
+        compute_digest,
+    )
+    from flytekit.tools.ignore import (
+        DockerIgnore,
+        GitIgnore,
+        IgnoreGroup,
+        StandardIgnore,
+    )
+    from flytekit.tools.script_mode import tar_strip_file_attributes
+
+    ignore = IgnoreGroup(source, [GitIgnore, DockerIgnore, StandardIgnore])
+    digest = compute_digest(source, ignore.is_ignored)
+    archive_path = pathlib.Path(output_dir) / (
+        f"{FAST_PREFIX}{digest}{FAST_FILEENDING}"
+    )
+
+    with gzip.GzipFile(filename=archive_path, mode="wb", mtime=0) as gzipped:
+        with tarfile.open(fileobj=gzipped, mode="w|", dereference=True) as tar:
+            tar.add(
+                source,
+                arcname="",
+                filter=lambda x: ignore.tar_filter(
+                    tar_strip_file_attributes(x)
+                ),
+            )
+
+    return archive_path
+
+
+def upload_fast_package(remote, package_path: str) -> str:
+    """
+    Packages `package_path` for fast registration and uploads the archive.
+
+    The archive is staged on tmpfs in `/dev/shm` where available, since
+    `FlyteRemote.upload_file` needs a path. If `/dev/shm` is missing or the
+    archive cannot be written there, e.g. because it is full, the default
+    temporary directory is used instead.
+
+    Args:
+        remote (FlyteRemote): The remote to upload the archive to.
+        package_path (str): The directory to package.
+
+    Returns:
+        str: The URL of the uploaded archive.
+    """
+    staging_dirs = ["/dev/shm"] if os.path.isdir("/dev/shm") else []
+    staging_dirs.append(tempfile.gettempdir())
+    for staging_dir in staging_dirs:
+        tmp_dir = None
+        try:
+            tmp_dir = tempfile.TemporaryDirectory(dir=staging_dir)
+            archive_path = fast_package_streaming(package_path, tmp_dir.name)
+        except OSError as e:
+            if tmp_dir is not None:
+                tmp_dir.cleanup()
+            if staging_dir == staging_dirs[-1]:
+                raise
+            logger.warning(
+                "Could not stage the package in %s, retrying in %s: %s",
+                staging_dir,
+                staging_dirs[-1],
+                e,
+            )
+            continue
+        with tmp_dir:
+            _, upload_url = remote.upload_file(archive_path)
+        return upload_url
+
+
 def get_serialization_settings(
     cluster_mode, execution_context, entity_config, remote, image_config
 ):
-    if cluster_mode == ClusterMode.dev:
+    from flytekit.configuration import (
+        FastSerializationSettings,
+        SerializationSettings,
+    )
+
+    if cluster_mode is ClusterMode.dev:
         logger.warning(
             "Development mode. Use 'prod' mode for production or CI environments."
         )
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            _, upload_url = remote.fast_package(
-                pathlib.Path(execution_context.package_path), output=tmp_dir
-            )
-        logger.info(f"Workflow package uploaded to:\n\n{upload_url}\n")
+        upload_url = upload_fast_package(remote, execution_context.package_path)
+        logger.info("Workflow package uploaded to:\n\n%s\n", upload_url)
         return SerializationSettings(
             image_config=image_config,
             fast_serialization_settings=FastSerializationSettings(
@@ -165,9 +380,11 @@ def get_serialization_settings(
                 distribution_location=upload_url,
             ),
         )
-    elif cluster_mode == ClusterMode.prod:
+    elif cluster_mode is ClusterMode.prod:
         logger.info(
-            f"Registering workflow: {entity_config.module_name}.{entity_config.entity_name}"
+            "Registering workflow if the version does not exist: %s.%s",
+            entity_config.module_name,
+            entity_config.entity_name,
         )
         return SerializationSettings(image_config=image_config)
     else:
@@ -177,23 +394,31 @@ def get_serialization_settings(
 def register_and_execute_workflow(
     remote, entity, entity_config, execution_context, serialization_settings
 ):
-    if isinstance(entity, WorkflowBase):
-        remote.register_workflow(
-            entity=entity,
-            serialization_settings=serialization_settings,
-            version=execution_context.version,
-        )
-    elif isinstance(entity, PythonTask):
-        remote.register_task(
-            entity=entity,
-            serialization_settings=serialization_settings,
-            version=execution_context.version,
-        )
+    import pyperclip
+
+    # remote.execute fetches the entity and only registers it, with the image
+    # configuration, if the version does not exist yet, which covers prod.
+    # Fast registered dev versions are unique and need the fast serialization
+    # settings, so they are registered here.
+    if serialization_settings.should_fast_serialize():
+        if isinstance(entity, WorkflowBase):
+            remote.register_workflow(
+                entity=entity,
+                serialization_settings=serialization_settings,
+                version=execution_context.version,
+            )
+        elif isinstance(entity, PythonTask):
+            remote.register_task(
+                entity=entity,
+                serialization_settings=serialization_settings,
+                version=execution_context.version,
+            )
     execution = remote.execute(
         entity=entity,
         inputs=entity_config.inputs,
         version=execution_context.version,
         execution_name_prefix=execution_context.version,
+        image_config=serialization_settings.image_config,
         wait=False,
     )
     execution_url = remote.generate_console_url(execution)
@@ -201,22 +426,94 @@ def register_and_execute_workflow(
     try:
         pyperclip.copy(execution_url)
     except Exception as e:
-        logger.warning(f"Failed to copy execution URL to clipboard: {e}")
+        logger.warning("Failed to copy execution URL to clipboard: %s", e)
     logger.info(
-        f"Execution submitted: {execution}\nExecution url:\n\n{execution_url}\n"
+        "Execution submitted: %s\nExecution url:\n\n%s\n",
+        execution,
+        execution_url,
     )
 
     if execution_context.wait:
-        wait_for_workflow_completion(execution, remote, logger)
+        wait_for_workflow_completion(
+            execution,
+            remote,
+            logger,
+            poll_interval=execution_context.poll_interval,
+            poll_backoff=execution_context.poll_backoff,
+            poll_max=execution_context.poll_max,
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def enum_values(enum_class) -> str:
+    """
+    Returns the comma-separated values of an enum, computed once per enum.
+
+    Example:
+        >>> enum_values(ClusterMode)
+        'DEV, PROD'
+    """
+    return ", ".join(e.value for e in enum_class)
 
 
 def raise_invalid_mode_error(mode, valid_modes):
     logger.error(
-        f"Invalid mode: {mode}. Please set to one of the following: {', '.join([e.value for e in valid_modes])}."
+        "Invalid mode: %s. Please set to one of the following: %s.",
+        mode,
+        enum_values(valid_modes),
     )
     sys.exit(1)
 
 
+@functools.lru_cache(maxsize=1)
+def get_syntax_theme():
+    """
+    Returns the syntax theme used to highlight the execution configuration.
+
+    Looking up a pygments theme builds a new style object, so the theme is
+    created once per process.
+    """
+    import rich.syntax
+
+    return rich.syntax.Syntax.get_theme("monokai")
+
+
+def log_execution_config(zen_cfg: DictConfig) -> None:
+    """
+    Logs the resolved execution configuration.
+
+    On an interactive terminal, the configuration is serialized to YAML only
+    if INFO messages are enabled. Hydra also saves it in the job output
+    directory, so non-interactive runs, e.g. CI, only log it at DEBUG level.
+    Syntax highlighting with rich is comparatively expensive, so the
+    highlighted tree is only rendered at DEBUG level on an interactive
+    terminal or when the `FLYTEZEN_PRETTY` environment variable is set to 1.
+    """
+    pretty = os.environ.get("FLYTEZEN_PRETTY") == "1"
+    interactive = sys.stdout.isatty()
+    if not logger.isEnabledFor(
+        logging.INFO if pretty or interactive else logging.DEBUG
+    ):
+        return
+
+    config_yaml = to_yaml(zen_cfg)
+    if pretty or (interactive and logger.isEnabledFor(logging.DEBUG)):
+        import rich.syntax
+        import rich.tree
+
+        tree = rich.tree.Tree(
+            "execute_workflow", style="dim", guide_style="dim"
+        )
+        tree.add(
+            rich.syntax.Syntax(config_yaml, "yaml", theme=get_syntax_theme())
+        )
+        rich.print(tree)
+    elif interactive:
+        logger.info("execute_workflow config:\n\n%s\n", config_yaml)
+    else:
+        logger.debug("execute_workflow config:\n\n%s\n", config_yaml)
+
+
 def execute_workflow(
     zen_cfg: DictConfig,
     execution_context: ExecutionContext,
@@ -266,33 +563,28 @@ def execute_workflow(
     Raises:
         Sets exit status one if an invalid execution mode is specified.
     """
-    config_yaml = to_yaml(zen_cfg)
-    tree = rich.tree.Tree("execute_workflow", style="dim", guide_style="dim")
-    tree.add(rich.syntax.Syntax(config_yaml, "yaml", theme="monokai"))
-    rich.print(tree)
+    log_execution_config(zen_cfg)
 
-    module = importlib.import_module(
-        f"{execution_context.import_path}.{entity_config.module_name}"
+    entity = load_entity(
+        execution_context.import_path,
+        entity_config.module_name,
+        entity_config.entity_name,
     )
-    entity = getattr(module, entity_config.entity_name)
 
     exec_mode = execution_context.mode
 
-    if exec_mode.location == ExecutionLocation.local:
-        if not handle_local_execution(
-            exec_mode, execution_context, entity, entity_config
-        ):
-            raise_invalid_mode_error(exec_mode.local_config.mode, LocalMode)
-
-    elif exec_mode.location == ExecutionLocation.remote:
-        if not handle_remote_execution(
-            exec_mode, execution_context, entity, entity_config
-        ):
-            raise_invalid_mode_error(exec_mode.remote_config.mode, ClusterMode)
-
-    else:
+    try:
+        handler, config_name, valid_modes = EXECUTION_HANDLERS[
+            exec_mode.location
+        ]
+    except KeyError:
         raise_invalid_mode_error(exec_mode.location, ExecutionLocation)
 
+    if not handler(exec_mode, execution_context, entity, entity_config):
+        raise_invalid_mode_error(
+            getattr(exec_mode, config_name).mode, valid_modes
+        )
+
 
 def main() -> None:
     """
@@ -315,7 +607,10 @@ def main() -> None:
     repo name, branch, and commit SHA.
     """
 
+    from dotenv import load_dotenv
+
     load_dotenv()
+    workflow_env = WorkflowEnv.from_environ()
 
     # equivalent to
     # hydra_zen.wrapper._implementations.store
@@ -328,76 +623,63 @@ def main() -> None:
 
     store(generate_hydra_config())
 
-    repo_name, git_branch, git_short_sha = git_info_to_workflow_version(logger)
+    repo_name, git_branch, git_short_sha = git_info_to_workflow_version()
 
-    workflow_image = os.environ.get(
-        "WORKFLOW_IMAGE",
-        f"localhost:30000/{repo_name}",
-    )
+    workflow_image = workflow_env.image or f"localhost:30000/{repo_name}"
 
     ExecutionContextConf = builds(ExecutionContext)
 
-    # Local Shell
-    local_shell_execution_context = ExecutionContextConf(
-        mode=local_shell_config,
-        image="",
-        tag="",
-        version=f"{repo_name}-{git_branch}-{git_short_sha}-local-{random_alphanumeric_suffix()}",
-    )
-
-    # Local Cluster Dev
-    local_cluster_dev_execution_context = ExecutionContextConf(
-        mode=local_cluster_dev_config,
-        image=f"localhost:30000/{repo_name}",
-        tag=git_branch,
-        version=f"{repo_name}-{git_branch}-{git_short_sha}-local-{random_alphanumeric_suffix()}",
-    )
-
-    # Local Cluster Prod
-    local_cluster_prod_execution_context = ExecutionContextConf(
-        mode=local_cluster_prod_config,
-        image=f"localhost:30000/{repo_name}",
-        tag=git_short_sha,
-        version=f"{repo_name}-{git_branch}-{git_short_sha}",
-    )
-
-    # Remote Dev
-    remote_dev_execution_context = ExecutionContextConf(
-        mode=remote_dev_config,
-        image=workflow_image,
-        tag=git_branch,
-        version=f"{repo_name}-{git_branch}-{git_short_sha}-dev-{random_alphanumeric_suffix()}",
-    )
-
-    # Remote Prod
-    remote_prod_execution_context = ExecutionContextConf(
-        mode=remote_prod_config,
-        image=workflow_image,
-        tag=git_short_sha,
-        version=f"{repo_name}-{git_branch}-{git_short_sha}",
-    )
+    version = f"{repo_name}-{git_branch}-{git_short_sha}"
+    local_image = f"localhost:30000/{repo_name}"
+
+    # name: (mode, image, tag, development version label or None)
+    execution_contexts = {
+        "local_shell": (local_shell_config, "", "", "local"),
+        "local_cluster_dev": (
+            local_cluster_dev_config,
+            local_image,
+            git_branch,
+            "local",
+        ),
+        "local_cluster_prod": (
+            local_cluster_prod_config,
+            local_image,
+            git_short_sha,
+            None,
+        ),
+        "remote_dev": (remote_dev_config, workflow_image, git_branch, "dev"),
+        "remote_prod": (
+            remote_prod_config,
+            workflow_image,
+            git_short_sha,
+            None,
+        ),
+    }
 
     # define the execution_context store
     execution_context_store = store(group="execution_context")
 
-    execution_context_store(local_shell_execution_context, name="local_shell")
-    execution_context_store(
-        local_cluster_dev_execution_context, name="local_cluster_dev"
-    )
-    execution_context_store(
-        local_cluster_prod_execution_context, name="local_cluster_prod"
-    )
-    execution_context_store(remote_dev_execution_context, name="remote_dev")
-    execution_context_store(remote_prod_execution_context, name="remote_prod")
+    for name, (mode, image, tag, dev_label) in execution_contexts.items():
+        # development versions are made unique with a random suffix
+        context_version = (
+            version
+            if dev_label is None
+            else f"{version}-{dev_label}-{random_alphanumeric_suffix()}"
+        )
+        execution_context_store(
+            ExecutionContextConf(
+                mode=mode, image=image, tag=tag, version=context_version
+            ),
+            name=name,
+        )
 
     # define the entity_config store
     entity_config_store = store(group="entity_config")
 
     # specify the parent module whose submodules will be inspected for workflows
-    parent_module_path = os.environ.get(
-        "WORKFLOW_PARENT_MODULE_PATH", "flytezen.workflows"
+    generate_entity_configs(
+        workflow_env.parent_module_path, entity_config_store, logger
     )
-    generate_entity_configs(parent_module_path, entity_config_store, logger)
 
     hydra_defaults = [
         "_self_",
@@ -409,7 +691,7 @@ def main() -> None:
         # {"execution_context": "local_shell"},
         # {"entity_config": "lrwine_process_data"},
     ]
-    logger.debug(f"hydra_defaults: {hydra_defaults}")
+    logger.debug("hydra_defaults: %s", hydra_defaults)
 
     ExecuteWorkflowConf = make_config(
         hydra_defaults=hydra_defaults,
@@ -513,9 +795,17 @@ if __name__ == "__main__":
             entity_config=lrwine_process_data \
             entity_config.inputs._args_.0.data.data=[[12.0, 0],[13.0, 1],[9.5, 2]] \
             entity_config.inputs._args_.0.data.columns="[ash, target]"
-        # TODO: update to use joblib hydra execution backend
+        # Sweep jobs run one after another in the same process
         > flytezen \
             --multirun entity_config.inputs._args_.0.logistic_regression.C=0.2,0.5
+        # The joblib launcher runs sweep jobs in parallel worker processes.
+        # Workers cannot prompt to terminate executions on Ctrl+C, so do not
+        # wait for completion, and prefer a prod context since dev jobs would
+        # each package and register the same version concurrently.
+        > flytezen hydra/launcher=joblib \
+            execution_context=remote_prod \
+            execution_context.wait=False \
+            --multirun entity_config.inputs._args_.0.logistic_regression.C=0.2,0.5
 
         See the the hydra config output in the git-ignored `./outputs` or
         `./multirun` directories. These are also stored as an artifact of
@@ -19,18 +19,18 @@ class ExecutionLocation(Enum):
     remote = "REMOTE"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClusterConfig:
     mode: ClusterMode = field(default_factory=lambda: ClusterMode.dev)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LocalConfig:
     mode: LocalMode = field(default_factory=lambda: LocalMode.shell)
     cluster_config: ClusterConfig = field(default_factory=ClusterConfig)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecutionMode:
     """
     Constructs configurations for each leaf node marked with a `#` in the supported
@@ -67,6 +67,10 @@ ExecutionModeConf = fbuilds(ExecutionMode)
 # Default Execution Configuration
 default_execution_config = ExecutionModeConf()
 
+# cluster configs are shared by the local cluster and remote execution modes
+cluster_dev_config = ClusterConfigConf(mode=ClusterMode.dev)
+cluster_prod_config = ClusterConfigConf(mode=ClusterMode.prod)
+
 # Local Shell Configuration
 local_shell_config = ExecutionModeConf(
     location=ExecutionLocation.local,
@@ -82,7 +86,7 @@ local_cluster_dev_config = ExecutionModeConf(
     location=ExecutionLocation.local,
     local_config=LocalConfigConf(
         mode=LocalMode.cluster,
-        cluster_config=ClusterConfigConf(mode=ClusterMode.dev),
+        cluster_config=cluster_dev_config,
     ),
     remote_config=None,
 )
@@ -92,7 +96,7 @@ local_cluster_prod_config = ExecutionModeConf(
     location=ExecutionLocation.local,
     local_config=LocalConfigConf(
         mode=LocalMode.cluster,
-        cluster_config=ClusterConfigConf(mode=ClusterMode.prod),
+        cluster_config=cluster_prod_config,
     ),
     remote_config=None,
 )
@@ -101,14 +105,14 @@ local_cluster_prod_config = ExecutionModeConf(
 remote_dev_config = ExecutionModeConf(
     location=ExecutionLocation.remote,
     local_config=None,
-    remote_config=ClusterConfigConf(mode=ClusterMode.dev),
+    remote_config=cluster_dev_config,
 )
 
 # Remote Prod Configuration
 remote_prod_config = ExecutionModeConf(
     location=ExecutionLocation.remote,
     local_config=None,
-    remote_config=ClusterConfigConf(mode=ClusterMode.prod),
+    remote_config=cluster_prod_config,
 )
 
 if __name__ == "__main__":
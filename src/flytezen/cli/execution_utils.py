@@ -1,32 +1,57 @@
+import base64
+import builtins
+import contextlib
+import functools
+import hashlib
 import importlib
 import inspect
 import logging
+import math
 import os
 import pkgutil
 import queue
+import random
 import secrets
+import select
+import signal
+import socket
 import sys
 import threading
 import time
 from dataclasses import dataclass
-from datetime import timedelta
 from textwrap import dedent
-from typing import Any, Dict, List, Tuple, Union
-
-from dataclasses_json import dataclass_json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from dulwich.config import ConfigFile
 from dulwich.repo import NotGitRepository, Repo
 from flytekit import WorkflowExecutionPhase
 from flytekit.core.base_task import PythonTask
 from flytekit.core.workflow import WorkflowBase
 from flytekit.exceptions.system import FlyteSystemException
-from flytekit.exceptions.user import FlyteTimeout
-from flytekit.remote import FlyteRemote
-from flytekit.remote.executions import FlyteWorkflowExecution
 from hydra.conf import HelpConf, HydraConf, JobConf
 from hydra_zen import ZenStore, builds, make_custom_builds_fn
 
+from flytezen.logging import configure_logging
+
+if TYPE_CHECKING:
+    # flytekit.remote is only needed for cluster executions, which import it
+    # when they create the remote
+    from flytekit.remote import FlyteRemote
+    from flytekit.remote.executions import FlyteWorkflowExecution
+
+logger = configure_logging("flytezen.cli.execution_utils")
+
 
-@dataclass_json
 @dataclass
 class EntityConfig:
     inputs: Dict[str, Any]
@@ -44,6 +69,32 @@ class EntityConfig:
 fbuilds = make_custom_builds_fn(populate_full_signature=True)
 
 
+@functools.lru_cache(maxsize=None)
+def load_entity(
+    import_path: str, module_name: str, entity_name: str
+) -> Union[WorkflowBase, PythonTask]:
+    """
+    Imports a workflow or task from a submodule of `import_path`.
+
+    The resolved entity is cached, so repeated executions of the same entity
+    skip building the object path and resolving it again.
+
+    Args:
+        import_path (str): The import path of the parent module.
+        module_name (str): The name of the submodule defining the entity.
+        entity_name (str): The name of the entity in the submodule.
+
+    Returns:
+        Union[WorkflowBase, PythonTask]: The workflow or task.
+
+    Example:
+        >>> entity = load_entity("flytezen.workflows", "lrwine", "get_data")
+        >>> entity is load_entity("flytezen.workflows", "lrwine", "get_data")
+        True
+    """
+    return pkgutil.resolve_name(f"{import_path}.{module_name}:{entity_name}")
+
+
 def generate_entity_configs(
     parent_module_path: str, entity_store: ZenStore, logger: logging.Logger
 ) -> None:
@@ -77,21 +128,22 @@ def generate_entity_configs(
     ):
         # import the submodule
         submodule = importlib.import_module(submodule_info.name)
+        module_name = submodule_info.name.rpartition(".")[2]
         logger.debug(f"Checking submodule: {submodule_info.name}")
 
-        # import entities that are instances of EntityTypes
-        entities = inspect.getmembers(
-            submodule,
-            # TODO: validate that PythonTasks function as expected
-            lambda member: isinstance(member, EntityTypes),
-            # lambda member: isinstance(member, WorkflowBase),
+        # import entities that are instances of EntityTypes, reading the
+        # module namespace directly rather than through getattr on dir()
+        # TODO: validate that PythonTasks function as expected
+        entities = sorted(
+            (name, member)
+            for name, member in vars(submodule).items()
+            if isinstance(member, EntityTypes)
         )
 
         for entity_name, entity in entities:
             logger.debug(f"Found entity: {entity_name}")
 
             # construct an instance (or a configuration) of the entity
-            module_name = submodule_info.name.split(".")[-1]
             entity_inputs = generate_entity_inputs(entity)
             entity_instance = fbuilds(
                 EntityConfig,
@@ -107,6 +159,75 @@ def generate_entity_configs(
             logger.debug(f"Stored entity: {composed_name} in entity_store")
 
 
+# the types defined in the builtins module, e.g. int, str, dict and NoneType
+BUILTIN_TYPES = frozenset(
+    [
+        obj
+        for obj in vars(builtins).values()
+        if isinstance(obj, type) and obj.__module__ == "builtins"
+    ]
+    + [type(None)]
+)
+
+
+def is_builtin_type(param_type: Any) -> bool:
+    """
+    Checks whether a parameter annotation is a type from the builtins module.
+
+    `BUILTIN_TYPES` answers the common case with a set lookup. Other
+    annotations fall back to checking the class and its module. This covers
+    parametrized generics such as `list[int]`, which are classes on Python
+    3.10. It also covers unhashable annotations, e.g. `Annotated` with
+    unhashable metadata.
+
+    Example:
+        >>> is_builtin_type(int), is_builtin_type(dict)
+        (True, True)
+        >>> from flytekit.types.file import FlyteFile
+        >>> is_builtin_type(FlyteFile)
+        False
+    """
+    try:
+        if param_type in BUILTIN_TYPES:
+            return True
+    except TypeError:
+        pass
+    return isinstance(param_type, type) and param_type.__module__ == "builtins"
+
+
+@functools.lru_cache(maxsize=None)
+def entity_parameters(
+    entity: Union[WorkflowBase, PythonTask],
+) -> Tuple[Tuple[str, Any, Any], ...]:
+    """
+    Returns the name, annotation and default of each parameter of an entity.
+
+    `inspect.signature` unwraps the entity and builds a `Parameter` object per
+    argument, so the scan is cached per entity.
+
+    Example:
+        >>> from flytezen.workflows.example import say_hello
+        >>> entity_parameters(say_hello)
+        (('name', <class 'str'>, 'testing say_hello'),)
+    """
+    return tuple(
+        (name, param.annotation, param.default)
+        for name, param in inspect.signature(entity).parameters.items()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def build_type_config(custom_type: type) -> type:
+    """
+    Returns a hydra-zen config that builds `custom_type` with its full
+    signature.
+
+    Populating the full signature introspects the type, so the config is
+    created once per type and shared by every entity input of that type.
+    """
+    return fbuilds(custom_type)
+
+
 def generate_entity_inputs(
     entity: Union[WorkflowBase, PythonTask],
 ) -> Dict[str, Any]:
@@ -117,7 +238,7 @@ def generate_entity_inputs(
     either a `WorkflowBase` or a `PythonTask`. For each parameter in the
     signature, it determines the type and default value (if any). If the type is
     a built-in type, it directly uses the default value. For custom types, it
-    dynamically imports and constructs a configuration object using `fbuilds`.
+    constructs a configuration object from the annotated type using `fbuilds`.
 
     Args:
         entity (Union[WorkflowBase, PythonTask]): The entity for which to
@@ -128,40 +249,64 @@ def generate_entity_inputs(
         inputs and values hydra-zen configurations that will build their
         respective default values.
     """
-    inputs = {}
-
-    for name, param in inspect.signature(entity).parameters.items():
-        param_type = param.annotation
-        default = param.default
-
-        # check if the type is a built-in type
-        if isinstance(param_type, type) and param_type.__module__ == "builtins":
-            inputs[name] = default
-        else:
-            # dynamically import the type if it's not a built-in type
-            type_module = importlib.import_module(param_type.__module__)
-            custom_type = getattr(type_module, param_type.__name__)
+    # built-in types use their default value directly, while custom types
+    # are built from the annotated type
+    return {
+        name: (
+            default
+            if is_builtin_type(param_type)
+            else build_type_config(param_type)
+        )
+        for name, param_type, default in entity_parameters(entity)
+    }
 
-            inputs[name] = fbuilds(custom_type)
 
-    return inputs
+def random_alphanumeric_suffix(input_string: str = "", length: int = 3) -> str:
+    """
+    Returns `length` random lowercase alphanumeric characters joined by
+    `input_string`.
 
+    The characters are drawn from the base32 alphabet (a-z and 2-7) by
+    encoding a single `secrets.token_bytes` read.
 
-def random_alphanumeric_suffix(input_string: str = "", length: int = 3) -> str:
-    return input_string.join(
-        secrets.choice("abcdefghijklmnopqrstuvwxyz0123456789")
-        for _ in range(length)
-    )
+    Example:
+        >>> len(random_alphanumeric_suffix())
+        3
+        >>> random_alphanumeric_suffix().isalnum()
+        True
+    """
+    encoded = base64.b32encode(secrets.token_bytes(length))
+    return input_string.join(encoded[:length].decode("ascii").lower())
 
 
 def check_required_env_vars(
-    required_vars: List[str], logger: logging.Logger
+    required_vars: List[str],
+    logger: logging.Logger,
+    env: Optional[Mapping[str, str]] = None,
 ) -> bool:
     """
     Checks required environment variables for workflow configuration.
+
+    Args:
+        required_vars (List[str]): Names of the required variables.
+        logger (logging.Logger): Logger used to report missing variables.
+        env (Optional[Mapping[str, str]]): Snapshot of the environment to
+        check. Defaults to `os.environ`.
+
+    Returns:
+        bool: True if all required variables are set, False otherwise.
+
+    Example:
+        >>> import logging
+        >>> env = {"WORKFLOW_IMAGE": "ghcr.io/sciexp/flytezen"}
+        >>> logger = logging.getLogger()
+        >>> check_required_env_vars(["WORKFLOW_IMAGE"], logger, env)
+        True
     """
+    if env is None:
+        env = os.environ
 
-    missing_vars = [var for var in required_vars if os.environ.get(var) is None]
+    missing_vars = [var for var in required_vars if var not in env]
     if missing_vars:
         missing_vars_str = ", ".join(missing_vars)
         logger.error(
@@ -171,9 +316,193 @@ def check_required_env_vars(
     return True
 
 
-def git_info_to_workflow_version(
-    logger: logging.Logger,
-) -> Tuple[str, str, str]:
+GIT_VERSION_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "flytezen",
+)
+# bump when the derivation of the cached values changes
+GIT_VERSION_CACHE_FORMAT = 3
+
+
+def git_version_cache_key(git_dir: str = ".git") -> Optional[str]:
+    """
+    Computes a key identifying the state of the git metadata used to derive
+    the workflow version.
+
+    The key covers the contents of `HEAD` and of the loose branch ref it
+    points to, i.e. the commit SHA, together with the modification time and
+    size of `HEAD`, `config`, `packed-refs` and that ref, so any commit,
+    checkout or remote change produces a new key. Including the SHA keeps
+    the key correct when a ref is rewritten within the filesystem's mtime
+    resolution, e.g. by `git commit --amend`.
+
+    Args:
+        git_dir (str): Path to the git directory.
+
+    Returns:
+        Optional[str]: A hex digest, or None if `HEAD` cannot be read.
+
+    Example:
+        >>> git_version_cache_key("/nonexistent/.git") is None
+        True
+    """
+    try:
+        with open(os.path.join(git_dir, "HEAD"), "rb") as head_file:
+            head = head_file.read()
+    except OSError:
+        return None
+
+    key_parts = [
+        str(GIT_VERSION_CACHE_FORMAT).encode(),
+        os.path.abspath(git_dir).encode(),
+        head,
+    ]
+    paths = ["HEAD", "config", "packed-refs"]
+    if head.startswith(b"ref: "):
+        ref = head[5:].strip().decode()
+        paths.append(ref)
+        try:
+            with open(os.path.join(git_dir, ref), "rb") as ref_file:
+                key_parts.append(ref_file.read())
+        except OSError:
+            # packed refs are covered by the packed-refs stat below
+            key_parts.append(b"ref:missing")
+    for path in paths:
+        try:
+            stat = os.stat(os.path.join(git_dir, path))
+            key_parts.append(
+                f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+            )
+        except OSError:
+            key_parts.append(f"{path}:missing".encode())
+
+    return hashlib.sha256(b"\0".join(key_parts)).hexdigest()[:16]
+
+
+def git_version_cache_path(git_dir: str = ".git") -> str:
+    """
+    Returns the cache file of a repository.
+
+    The cache holds a single entry per repository, which is overwritten
+    whenever its key changes, so the cache directory does not grow with
+    every commit or checkout.
+    """
+    repo_hash = hashlib.sha256(os.path.abspath(git_dir).encode()).hexdigest()
+    return os.path.join(GIT_VERSION_CACHE_DIR, f"git_ver_{repo_hash[:16]}.txt")
+
+
+def read_git_version_cache(
+    cache_key: str, git_dir: str = ".git"
+) -> Optional[Tuple[str, str, str]]:
+    """
+    Reads a cached repository name, branch name and short SHA, if they were
+    stored under `cache_key`.
+    """
+    try:
+        with open(git_version_cache_path(git_dir)) as cache_file:
+            lines = cache_file.read().splitlines()
+        stored_key, repo_name, branch_name, short_sha = lines
+    except (OSError, ValueError):
+        return None
+    if stored_key != cache_key:
+        return None
+    return repo_name, branch_name, short_sha
+
+
+def write_git_version_cache(
+    cache_key: str, git_info: Tuple[str, str, str], git_dir: str = ".git"
+) -> None:
+    """
+    Writes the repository name, branch name and short SHA to the cache,
+    replacing the repository's previous entry.
+    Failures are ignored since the cache is only an optimization.
+
+    The file is written to a temporary path and moved into place with
+    `os.replace`, so concurrent processes, e.g. parallel CLI invocations,
+    never read a partially written cache file.
+    """
+    cache_path = git_version_cache_path(git_dir)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(GIT_VERSION_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w") as cache_file:
+            cache_file.write("\n".join((cache_key, *git_info)) + "\n")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# length of a hex-encoded SHA-1 commit id stored in a loose ref
+SHA1_HEX_LENGTH = 40
+
+
+def read_loose_head(git_dir: str = ".git") -> Optional[Tuple[str, bytes]]:
+    """
+    Reads the current branch and commit from plain files in the git directory.
+
+    This covers the common case of `HEAD` pointing to a branch whose ref is
+    stored as a loose file. It returns None for a detached `HEAD`, packed
+    refs, worktrees and anything else unexpected, in which case the
+    repository should be read with Dulwich.
+
+    Args:
+        git_dir (str): Path to the git directory.
+
+    Returns:
+        Optional[Tuple[str, bytes]]: The branch name and hex commit SHA.
+
+    Example:
+        >>> read_loose_head("/nonexistent/.git") is None
+        True
+    """
+    try:
+        with open(os.path.join(git_dir, "HEAD"), "rb") as head_file:
+            head = head_file.read().strip()
+        if not head.startswith(b"ref: refs/heads/"):
+            return None
+        ref = head[len(b"ref: ") :].decode()
+        with open(os.path.join(git_dir, ref), "rb") as ref_file:
+            sha = ref_file.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    if len(sha) != SHA1_HEX_LENGTH or not all(
+        c in b"0123456789abcdef" for c in sha
+    ):
+        return None
+    return ref[len("refs/heads/") :], sha
+
+
+def repo_name_from_remote_url(remote_url: str) -> str:
+    """
+    Extracts the repository name from a git remote URL.
+
+    Handles URLs with and without a `.git` suffix, including scp-like SSH
+    remotes without a path separator.
+
+    Args:
+        remote_url (str): The remote URL.
+
+    Returns:
+        str: The repository name.
+
+    Example:
+        >>> repo_name_from_remote_url("https://github.com/sciexp/flytezen.git")
+        'flytezen'
+        >>> repo_name_from_remote_url("git@github.com:org/fig.git")
+        'fig'
+        >>> repo_name_from_remote_url("git@host:fig.git/")
+        'fig'
+    """
+    path = remote_url.rstrip("/").rpartition("/")[2]
+    return path.rpartition(":")[2].removesuffix(".git")
+
+
+@functools.lru_cache(maxsize=1)
+def git_info_to_workflow_version() -> Tuple[str, str, str]:
     """
     Retrieves git information for workflow versioning using Dulwich.
 
@@ -181,8 +510,11 @@ def git_info_to_workflow_version(
     It handles the case where the Git repository is in a detached HEAD state,
     common in CI environments like GitHub Actions for pull requests.
 
-    Args:
-        logger (logging.Logger): Logger object for logging messages.
+    Results are memoized for the lifetime of the process and cached on disk
+    under `$XDG_CACHE_HOME/flytezen`, one entry per repository keyed by
+    `git_version_cache_key`, so that repeated CLI invocations skip reading
+    the repository while `HEAD` has not moved. Results derived from the
+    environment variable fallbacks are not cached on disk.
 
     Returns:
         Tuple[str, str, str]: A tuple containing the repository name,
@@ -192,37 +524,63 @@ def git_info_to_workflow_version(
         ValueError: If unable to extract source commit SHA from commit message.
 
     Example:
-        >>> import logging
-        >>> logger = logging.getLogger()
         >>> # assuming this test is run in a git repository
-        >>> repo_name, branch, short_sha = git_info_to_workflow_version(logger)
+        >>> repo_name, branch, short_sha = git_info_to_workflow_version()
         >>> print(repo_name, branch, short_sha)
         >>> print(isinstance(repo_name, str), isinstance(branch, str), isinstance(short_sha, str))
         True True True
     """
     try:
-        try:
-            repo = Repo(".")
+        cache_key = git_version_cache_key()
+        if cache_key is not None:
+            cached_git_info = read_git_version_cache(cache_key)
+            if cached_git_info is not None:
+                return cached_git_info
 
-            config_stack = repo.get_config_stack()
-            remote_url = config_stack.get(
+        cacheable = True
+        try:
+            loose_head = read_loose_head()
+            if loose_head is not None:
+                # HEAD points to a loose branch ref, so the branch and commit
+                # are read from plain files without opening the repository
+                branch_name, head_commit = loose_head
+                repo_config = ConfigFile.from_path(
+                    os.path.join(".git", "config")
+                )
+            else:
+                repo = Repo(".")
+                repo_config = repo.get_config()
+
+                # resolve HEAD once; only scan the branch heads when detached
+                head_refs, head_commit = repo.refs.follow(b"HEAD")
+                branch_name = None
+                if head_commit is not None and head_refs[-1].startswith(
+                    b"refs/heads/"
+                ):
+                    branch_name = head_refs[-1][len(b"refs/heads/") :].decode()
+                elif head_commit is not None:
+                    branches = {
+                        name.decode(): sha
+                        for name, sha in repo.refs.as_dict(
+                            b"refs/heads"
+                        ).items()
+                    }
+                    logger.info(f"Found branches:\n{branches}")
+                    for name, sha in branches.items():
+                        if sha == head_commit:
+                            branch_name = name
+                            break
+
+            # remotes are defined in the repository config, so skip the
+            # user and system config files read by get_config_stack
+            remote_url = repo_config.get(
                 (b"remote", b"origin"), b"url"
             ).decode()
-            repo_name = os.path.basename(remote_url.rstrip("/")).rstrip(".git")
-
-            head_commit = repo.head()
-            branches = {
-                name.decode(): sha
-                for name, sha in repo.refs.as_dict(b"refs/heads").items()
-            }
-            logger.info(f"Found branches:\n{branches}")
-            branch_name = None
+            repo_name = repo_name_from_remote_url(remote_url)
+
             short_sha = None
-            for name, sha in branches.items():
-                if sha == repo.head():
-                    branch_name = name
-                    short_sha = head_commit.decode("utf-8")[:7]
-                    break
+            if branch_name is not None:
+                short_sha = head_commit.decode("utf-8")[:7]
 
             if branch_name is None:
                 logger.warning(
@@ -231,6 +589,7 @@ def git_info_to_workflow_version(
                     "Falling back to GIT_REPO_NAME, GIT_REF, GIT_SHA_SHORT env vars"
                     "or noref defaults: CWD, nobranch, 0000000."
                 )
+                cacheable = False
                 repo_name = os.environ.get(
                     "GIT_REPO_NAME", os.path.basename(os.getcwd())
                 )
@@ -244,6 +603,7 @@ def git_info_to_workflow_version(
                 "or CWD, nobranch, 0000000 defaults."
             )
             logger.warning(no_git_repo_fallback_message)
+            cacheable = False
             repo_name = os.environ.get(
                 "GIT_REPO_NAME", os.path.basename(os.getcwd())
             )
@@ -254,6 +614,11 @@ def git_info_to_workflow_version(
         branch_name = branch_name.lower()
         short_sha = short_sha.lower()
 
+        if cacheable and cache_key is not None:
+            write_git_version_cache(
+                cache_key, (repo_name, branch_name, short_sha)
+            )
+
         return repo_name, branch_name, short_sha
 
     except Exception as e:
@@ -265,7 +630,7 @@ def generate_hydra_config() -> HydraConf:
     return HydraConf(
         defaults=[
             {"output": "default"},
-            {"launcher": "basic"},  # joblib
+            {"launcher": "basic"},  # opt in with hydra/launcher=joblib
             {"sweeper": "basic"},
             {"help": "default"},
             {"hydra_help": "default"},
@@ -374,65 +739,267 @@ def generate_hydra_config() -> HydraConf:
     )
 
 
-def get_user_input(input_queue):
+def env_float(name: str, default: float, logger: logging.Logger) -> float:
+    """
+    Reads a positive float from an environment variable, falling back to
+    `default` if it is unset, invalid, not finite or not positive.
+
+    Example:
+        >>> import logging
+        >>> env_float("FLYTEZEN_UNSET_FLOAT", 3.0, logging.getLogger())
+        3.0
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        parsed = float(value)
+    except ValueError:
+        parsed = math.nan
+    if not math.isfinite(parsed) or parsed <= 0:
+        logger.warning(f"Invalid {name}={value!r}, using {default}.")
+        return default
+    return parsed
+
+
+TERMINAL_PHASES = frozenset(
+    {
+        WorkflowExecutionPhase.SUCCEEDED,
+        WorkflowExecutionPhase.FAILED,
+        WorkflowExecutionPhase.ABORTED,
+        WorkflowExecutionPhase.TIMED_OUT,
+    }
+)
+
+
+def is_terminal_phase(phase: int) -> bool:
+    """
+    Checks whether a workflow execution phase is terminal.
+
+    An execution in a terminal phase can no longer change state so there is no
+    need to continue polling for its status.
+
+    Example:
+        >>> is_terminal_phase(WorkflowExecutionPhase.SUCCEEDED)
+        True
+        >>> is_terminal_phase(WorkflowExecutionPhase.TIMED_OUT)
+        True
+        >>> is_terminal_phase(WorkflowExecutionPhase.RUNNING)
+        False
+    """
+    return phase in TERMINAL_PHASES
+
+
+class SigintEvent:
+    """
+    Records a SIGINT without taking any lock.
+
+    A `threading.Event` cannot be set from a signal handler: the handler runs
+    in the main thread, which may hold the event's lock inside `wait`, so the
+    handler would deadlock. Here the handler only sets a plain attribute, and
+    `wait` blocks in `select` on the socket registered with
+    `signal.set_wakeup_fd`, which the interpreter writes to on every signal.
+
+    Args:
+        wakeup_socket (socket.socket | None): The receiving end of the wakeup
+        socket pair, or None if no handler is installed.
+    """
+
+    def __init__(self, wakeup_socket: Optional[socket.socket] = None) -> None:
+        self.interrupted = False
+        self._wakeup_socket = wakeup_socket
+
+    def is_set(self) -> bool:
+        return self.interrupted
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Waits up to `timeout` seconds for a SIGINT and returns whether one was
+        received.
+        """
+        deadline = time.monotonic() + timeout
+        while not self.interrupted:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if self._wakeup_socket is None:
+                time.sleep(remaining)
+                continue
+            # a signal received before select still leaves a byte to read
+            readable, _, _ = select.select(
+                [self._wakeup_socket], [], [], remaining
+            )
+            if readable:
+                with contextlib.suppress(BlockingIOError):
+                    self._wakeup_socket.recv(512)
+        return self.interrupted
+
+
+@contextlib.contextmanager
+def sigint_event() -> Iterator[SigintEvent]:
+    """
+    Yields a `SigintEvent` that is set on SIGINT instead of raising
+    `KeyboardInterrupt`.
+
+    An interrupt then never unwinds through an in-flight flyteadmin request;
+    the caller checks the event between requests. The previous handler and
+    wakeup fd are restored on exit. A second SIGINT, once the event is set,
+    raises `KeyboardInterrupt` as usual. Signal handlers can only be
+    installed from the main thread, so elsewhere the event is never set and
+    SIGINT raises `KeyboardInterrupt` as usual.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield SigintEvent()
+        return
+
+    receiver, sender = socket.socketpair()
+    receiver.setblocking(False)
+    sender.setblocking(False)
+    interrupted = SigintEvent(receiver)
+
+    def handle_sigint(signum, frame):
+        if interrupted.interrupted:
+            signal.default_int_handler(signum, frame)
+        interrupted.interrupted = True
+
+    previous_wakeup_fd = signal.set_wakeup_fd(sender.fileno())
+    previous_handler = signal.signal(signal.SIGINT, handle_sigint)
+    try:
+        yield interrupted
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        signal.set_wakeup_fd(previous_wakeup_fd)
+        receiver.close()
+        sender.close()
+
+
+def get_user_input(
+    input_queue,
+    prompt: str = "Terminate workflow execution? (y/N after 1 min.): ",
+):
     """
     Gets user input and puts it in the queue.
     """
-    user_input = input("Terminate workflow execution? (y/N after 1 min.): ")
+    user_input = input(prompt)
     input_queue.put(user_input)
 
 
+def prompt_with_timeout(prompt: str, timeout: float) -> str:
+    """
+    Prompts for a line of user input, returning "n" after `timeout` seconds.
+
+    On POSIX systems stdin is waited on with `select`. Where stdin is not
+    selectable, e.g. on Windows, the prompt is read in a daemon thread.
+    """
+    if sys.platform != "win32":
+        try:
+            sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            pass
+        else:
+            print(prompt, end="", flush=True)
+            readable, _, _ = select.select([sys.stdin], [], [], timeout)
+            return sys.stdin.readline() if readable else "n"
+
+    input_queue = queue.Queue()
+    input_thread = threading.Thread(
+        target=get_user_input, args=(input_queue, prompt)
+    )
+    input_thread.daemon = True
+    input_thread.start()
+    try:
+        return input_queue.get(timeout=timeout)
+    except queue.Empty:
+        return "n"
+
+
 def wait_for_workflow_completion(
-    execution: FlyteWorkflowExecution,
-    remote: FlyteRemote,
+    execution: "FlyteWorkflowExecution",
+    remote: "FlyteRemote",
     logger: logging.Logger,
+    poll_interval: Optional[float] = None,
+    poll_max: Optional[float] = None,
+    poll_backoff: float = 1.5,
+    poll_jitter: float = 0.1,
 ) -> None:
     """
-    Waits for the execution to complete, checking status at regular intervals.
+    Waits for the execution to complete, checking status with an exponential
+    backoff.
+
+    The polling interval starts at `poll_interval` seconds and grows by a
+    factor of `poll_backoff` after each check up to `poll_max`. It is reset
+    to `poll_interval` whenever the execution phase changes so that state
+    transitions are reported promptly while long-running executions are
+    polled infrequently. If not given, they are read from the
+    `FLYTE_POLL_INITIAL_SEC` and `FLYTE_POLL_MAX_SEC` environment variables,
+    defaulting to 3 and 60. `poll_max` is raised to `poll_interval` if it is
+    smaller. Each sleep is stretched by a random fraction of
+    up to `poll_jitter` so that executions launched together, e.g. by a
+    multirun sweep, do not poll flyteadmin in lockstep.
+
+    Each poll only requests the execution phase from flyteadmin. The full
+    execution is synced once, after it reaches a terminal phase. SIGINT is
+    handled between polls, see `sigint_event`, and prompts whether to
+    terminate the execution.
     """
-    timeout_duration = timedelta(seconds=3.0)
-    synced_execution = None
+    if poll_interval is None:
+        poll_interval = env_float("FLYTE_POLL_INITIAL_SEC", 3.0, logger)
+    if poll_max is None:
+        poll_max = env_float("FLYTE_POLL_MAX_SEC", 60.0, logger)
+    poll_max = max(poll_max, poll_interval)
+    delay = poll_interval
+    last_phase = None
     try:
-        while True:
-            try:
-                completed_execution = remote.wait(
-                    execution, timeout=timeout_duration
-                )
-                logger.info(f"Execution completed:\n\n{completed_execution}\n")
-                if completed_execution.error is None:
-                    break
-                else:
-                    logger.error(
-                        f"Execution failed with error:\n\n{completed_execution.error}\n"
+        with sigint_event() as interrupted:
+            while True:
+                phase = remote.client.get_execution(execution.id).closure.phase
+                if is_terminal_phase(phase):
+                    synced_execution = remote.sync(execution)
+                    logger.info(f"Execution completed:\n\n{synced_execution}\n")
+                    if phase == WorkflowExecutionPhase.SUCCEEDED:
+                        break
+                    else:
+                        logger.error(
+                            f"Execution failed with error:\n\n{synced_execution.closure.error}\n"
+                        )
+                        sys.exit(1)
+
+                if phase != last_phase:
+                    logger.info(
+                        "Current status: "
+                        f"{WorkflowExecutionPhase.enum_to_string(phase)}"
                     )
-                    sys.exit(1)
-            except FlyteTimeout:
-                synced_execution = remote.sync(execution)
-                logger.info(f"Current status:\n\n{synced_execution}\n")
-                time.sleep(timeout_duration.total_seconds())
+                    last_phase = phase
+                    delay = poll_interval
+                if interrupted.wait(
+                    delay * (1 + poll_jitter * random.random())
+                ):
+                    # handled below, after the default SIGINT handler is
+                    # restored for the termination prompt
+                    raise KeyboardInterrupt
+                delay = min(delay * poll_backoff, poll_max)
     except KeyboardInterrupt:
-        if synced_execution is not None:
-            logger.info(f"Status at KeyboardInterrupt:\n\n{synced_execution}\n")
+        if last_phase is not None:
+            logger.info(
+                "Status at KeyboardInterrupt: "
+                f"{WorkflowExecutionPhase.enum_to_string(last_phase)}"
+            )
         else:
             logger.info(
                 "KeyboardInterrupt caught before execution status sync."
             )
 
-        input_queue = queue.Queue()
-        input_thread = threading.Thread(
-            target=get_user_input, args=(input_queue,)
-        )
-        input_thread.daemon = True
-        input_thread.start()
-
         try:
-            response = input_queue.get(timeout=60)
-            response = response.strip().lower()
-        except queue.Empty:
+            response = prompt_with_timeout(
+                "Terminate workflow execution? (y/N after 1 min.): ", 60
+            )
+        except KeyboardInterrupt:
             response = "n"
+        response = response.strip().lower()
 
-        synced_execution = remote.sync(execution)
-        if synced_execution.closure.phase in [WorkflowExecutionPhase.RUNNING]:
+        # only the phase is needed to decide whether to terminate
+        phase = remote.client.get_execution(execution.id).closure.phase
+        if phase in [WorkflowExecutionPhase.RUNNING]:
             try:
                 if response in ["y", "yes"]:
                     remote.terminate(
@@ -449,7 +1016,8 @@ def wait_for_workflow_completion(
                 )
         else:
             logger.info(
-                f"Workflow execution already in terminal state: {synced_execution.closure.phase}"
+                "Workflow execution already in terminal state: "
+                f"{WorkflowExecutionPhase.enum_to_string(phase)}"
             )
 
         sys.exit()
@@ -476,19 +1044,13 @@ def generate_workflow_inputs(
 
     inputs = {}
 
-    for name, param in inspect.signature(workflow).parameters.items():
-        param_type = param.annotation
-        default = param.default
-
+    for name, param_type, default in entity_parameters(workflow):
         # check if the type is a built-in type (like int, str, etc.)
-        if isinstance(param_type, type) and param_type.__module__ == "builtins":
+        if is_builtin_type(param_type):
             inputs[name] = default
         else:
-            # dynamically import the type if it's not a built-in type
-            type_module = importlib.import_module(param_type.__module__)
-            custom_type = getattr(type_module, param_type.__name__)
-
-            inputs[name] = builds(custom_type)
+            # the annotation is already the custom type, so it is built as is
+            inputs[name] = builds(param_type)
 
     return inputs
 
@@ -1,7 +1,7 @@
 import dataclasses
+import functools
 import inspect
 import sys
-from dataclasses import field
 from typing import (
     Any,
     Callable,
@@ -14,7 +14,6 @@ from typing import (
 )
 
 from mashumaro.mixins.json import DataClassJSONMixin
-from sklearn.linear_model import LogisticRegression
 
 
 def infer_type_from_default(value: Any) -> Type:
@@ -56,6 +55,7 @@ def create_dataclass_from_callable(
 
     Examples:
         >>> from pprint import pprint
+        >>> from sklearn.linear_model import LogisticRegression
         >>> custom_types_defaults: Dict[str, Tuple[Type, Any]] = {
         ...     "penalty": (str, "l2"),
         ...     "class_weight": (Optional[dict], None),
@@ -88,28 +88,14 @@ def create_dataclass_from_callable(
                                     n_jobs=None,
                                     l1_ratio=None)
     """
-    if inspect.isclass(callable_obj):
-        func = callable_obj.__init__
-    else:
-        func = callable_obj
-
-    signature = inspect.signature(func)
-    type_hints = get_type_hints(func)
-
     fields = []
-    for name, param in signature.parameters.items():
-        if name == "self":
-            continue
-
+    for name, inferred_type, default in callable_parameters(callable_obj):
         if overrides and name in overrides:
             field_type, default_value = overrides[name]
         else:
-            inferred_type = infer_type_from_default(param.default)
-            field_type = type_hints.get(name, inferred_type)
+            field_type = inferred_type
             default_value = (
-                param.default
-                if param.default is not inspect.Parameter.empty
-                else dataclasses.field(default_factory=lambda: None)
+                default if default is not inspect.Parameter.empty else None
             )
 
         fields.append((name, field_type, default_value))
@@ -117,6 +103,43 @@ def create_dataclass_from_callable(
     return fields
 
 
+@functools.lru_cache(maxsize=None)
+def callable_parameters(
+    callable_obj: Callable,
+) -> Tuple[Tuple[str, Type, Any], ...]:
+    """
+    Returns the name, type and default of each parameter of a callable,
+    excluding `self`. Types are taken from the type hints of the callable or
+    inferred from the parameter defaults.
+
+    The type hints are resolved once with `get_type_hints`, which also
+    evaluates string annotations and strips `Annotated` metadata, and the
+    result is cached per callable.
+
+    Example:
+        >>> def f(a: int, b=1.0): ...
+        >>> callable_parameters(f)
+        (('a', <class 'int'>, <class 'inspect._empty'>), ('b', <class 'float'>, 1.0))
+    """
+    if inspect.isclass(callable_obj):
+        func = callable_obj.__init__
+    else:
+        func = callable_obj
+
+    signature = inspect.signature(func)
+    type_hints = get_type_hints(func)
+
+    return tuple(
+        (
+            name,
+            type_hints.get(name, infer_type_from_default(param.default)),
+            param.default,
+        )
+        for name, param in signature.parameters.items()
+        if name != "self"
+    )
+
+
 # -----------
 # Deprecated
 # -----------
@@ -126,6 +149,10 @@ class TypeInferenceError(Exception):
     pass
 
 
+# the types that can be inferred from a default value, in order of precedence
+JSON_DEFAULT_TYPES = {t: t for t in (bool, int, float, str, list, dict)}
+
+
 def infer_type_from_default_json(
     default: Any, name: str, custom_types: Optional[Dict[str, Type]] = None
 ) -> Type:
@@ -177,25 +204,22 @@ def infer_type_from_default_json(
         )
         raise TypeInferenceError(type_inference_error_message)
 
-    elif isinstance(default, bool):
-        return bool
-    elif isinstance(default, int):
-        return int
-    elif isinstance(default, float):
-        return float
-    elif isinstance(default, str):
-        return str
-    elif isinstance(default, list):
-        return list
-    elif isinstance(default, dict):
-        return dict
-    else:
+    inferred_type = JSON_DEFAULT_TYPES.get(type(default))
+    if inferred_type is None:
+        # subclasses of the supported types, e.g. numpy.float64, are matched
+        # in order so that bool takes precedence over int
+        inferred_type = next(
+            (t for t in JSON_DEFAULT_TYPES if isinstance(default, t)), None
+        )
+    if inferred_type is None:
         type_inference_error_message = (
             f"Type for parameter '{name}' with default value {default} cannot be inferred.\n"
             "Add this parameter to the custom_types dictionary.\n"
         )
         raise TypeInferenceError(type_inference_error_message)
 
+    return inferred_type
+
 
 def create_dataclass_from_callable_json(
     callable_obj: Callable, custom_types: Optional[Dict[str, Type]] = None
@@ -297,13 +321,10 @@ def create_dataclass_from_callable_json(
         except TypeInferenceError as e:
             raise TypeInferenceError(str(e)) from e
 
-        default = (
+        class_attrs[name] = (
             param.default
             if param.default is not inspect.Parameter.empty
-            else field(default_factory=lambda: None)
-        )
-        class_attrs[name] = (
-            field(default=default) if default is field else default
+            else None
         )
         class_attrs["__annotations__"][name] = field_type
 
@@ -326,6 +347,8 @@ if __name__ == "__main__":
 
     import pprint
 
+    from sklearn.linear_model import LogisticRegression
+
     custom_types_defaults: Dict[str, Tuple[Type, Any]] = {
         # "penalty": (str, "l2"),
         # "dual": (bool, False),
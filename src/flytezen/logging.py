@@ -1,9 +1,51 @@
 import logging
 import os
 
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.theme import Theme
+
+class LazyRichHandler(logging.Handler):
+    """
+    Logging handler that creates the rich console and handler on the first
+    emitted record.
+
+    Constructing a rich `Console` probes the terminal, so processes that never
+    emit a record at the configured level, e.g. with `LOG_LEVEL=ERROR`, skip
+    it entirely.
+    """
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self._handler = None
+
+    def _create_handler(self) -> logging.Handler:
+        from rich.console import Console
+        from rich.logging import RichHandler
+        from rich.theme import Theme
+
+        console_theme = Theme(
+            {
+                "logging.level.info": "dim cyan",
+                "logging.level.warning": "magenta",
+                "logging.level.error": "bold red",
+                "logging.level.debug": "green",
+            }
+        )
+        console = Console(theme=console_theme)
+        rich_handler = RichHandler(
+            console=console,
+            rich_tracebacks=True,
+            show_time=True,
+            show_level=True,
+            show_path=False,
+            markup=True,
+            log_time_format="[%X]",
+        )
+        rich_handler.setFormatter(self.formatter)
+        return rich_handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._handler is None:
+            self._handler = self._create_handler()
+        self._handler.emit(record)
 
 
 def configure_logging(logger_name: str = "flytezen") -> logging.Logger:
@@ -12,25 +54,16 @@ def configure_logging(logger_name: str = "flytezen") -> logging.Logger:
     environment.
 
     Defaults to `INFO` if no valid log level is found.
+
+    The handler is only installed on the first call; subsequent calls return
+    the named logger, which inherits the root handler.
     """
-    console_theme = Theme(
-        {
-            "logging.level.info": "dim cyan",
-            "logging.level.warning": "magenta",
-            "logging.level.error": "bold red",
-            "logging.level.debug": "green",
-        }
-    )
-    console = Console(theme=console_theme)
-    rich_handler = RichHandler(
-        console=console,
-        rich_tracebacks=True,
-        show_time=True,
-        show_level=True,
-        show_path=False,
-        markup=True,
-        log_time_format="[%X]",
-    )
+    if any(
+        isinstance(handler, LazyRichHandler)
+        for handler in logging.getLogger().handlers
+    ):
+        return logging.getLogger(logger_name)
+
     valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 
@@ -41,6 +74,6 @@ def configure_logging(logger_name: str = "flytezen") -> logging.Logger:
         level=log_level,
         format="%(name)s %(message)s",
         datefmt="[%X]",
-        handlers=[rich_handler],
+        handlers=[LazyRichHandler()],
     )
     return logging.getLogger(logger_name)
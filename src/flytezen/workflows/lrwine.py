@@ -1,5 +1,7 @@
-from dataclasses import asdict, make_dataclass
+import logging
+from dataclasses import fields, make_dataclass
 from datetime import timedelta
+from functools import lru_cache
 from pprint import pformat
 from typing import Any, Dict, Optional, Tuple, Type
 
@@ -11,7 +13,6 @@ from flytekit import Resources, task, workflow
 from flytekit.extras.accelerators import T4
 from flytekit.types.file import JoblibSerializedFile
 from mashumaro.mixins.json import DataClassJSONMixin
-from sklearn.datasets import load_wine
 from sklearn.linear_model import LogisticRegression
 
 from flytezen.configuration import create_dataclass_from_callable
@@ -50,11 +51,18 @@ LogisticRegressionInterface = make_dataclass(
     "LogisticRegressionInterface",
     logistic_regression_fields,
     bases=(DataClassJSONMixin,),
+    slots=True,
     # TODO: Python 3.12, https://github.com/python/cpython/pull/102104
     # module=__name__,
 )
 LogisticRegressionInterface.__module__ = __name__
 
+# the hyperparameters are flat, so they are passed to the estimator without
+# the recursive copy made by `asdict`
+logistic_regression_field_names = tuple(
+    f.name for f in fields(LogisticRegressionInterface)
+)
+
 
 # The following can be used to test dynamic dataclass construction
 # with multiple dataclasses of distinct types.
@@ -86,6 +94,21 @@ sample_data = [
     [12.5, 2],
 ]
 
+# shared default input of the tasks below, which do not modify it
+sample_frame = pd.DataFrame(data=sample_data, columns=sample_columns)
+
+
+@lru_cache(maxsize=1)
+def load_wine_frame() -> pd.DataFrame:
+    """
+    Loads the wine dataset once per process. `get_data` returns copies so the
+    cached frame is never mutated.
+    """
+    # sklearn.datasets is only needed when the data is loaded
+    from sklearn.datasets import load_wine
+
+    return load_wine(as_frame=True).frame
+
 
 @task(
     cache=True,
@@ -106,7 +129,7 @@ def get_data() -> pd.DataFrame:
     # import time
 
     # time.sleep(7200)
-    return load_wine(as_frame=True).frame
+    return load_wine_frame().copy()
 
 
 @task(
@@ -118,12 +141,17 @@ def get_data() -> pd.DataFrame:
     requests=Resources(cpu="200m", mem="400Mi", ephemeral_storage="1Gi"),
 )
 def process_data(
-    data: pd.DataFrame = pd.DataFrame(data=sample_data, columns=sample_columns),
+    data: pd.DataFrame = sample_frame,
 ) -> pd.DataFrame:
     """
     Simplify the task from a 3-class to a binary classification problem.
     """
-    return data.assign(target=lambda x: x["target"].where(x["target"] == 0, 1))
+    # a shallow copy shares the feature columns with the input, unlike assign,
+    # and replacing the target column leaves the input unchanged
+    processed_data = data.copy(deep=False)
+    target = processed_data["target"]
+    processed_data["target"] = target.ne(0).astype(target.dtype)
+    return processed_data
 
 
 @task(
@@ -135,7 +163,7 @@ def process_data(
     requests=Resources(cpu="200m", mem="400Mi", ephemeral_storage="1Gi"),
 )
 def train_model(
-    data: pd.DataFrame = pd.DataFrame(data=sample_data, columns=sample_columns),
+    data: pd.DataFrame = sample_frame,
     logistic_regression: LogisticRegressionInterface = LogisticRegressionInterface(
         max_iter=1200
     ),
@@ -145,10 +173,16 @@ def train_model(
     """
     features = data.drop("target", axis="columns")
     target = data["target"]
-    logger.info(f"{pformat(logistic_regression)}\n\n")
-    model = LogisticRegression(**asdict(logistic_regression))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s\n\n", pformat(logistic_regression))
+    model = LogisticRegression(
+        **{
+            name: getattr(logistic_regression, name)
+            for name in logistic_regression_field_names
+        }
+    )
     model_path = "logistic_regression_model.joblib"
-    joblib.dump(model, model_path)
+    joblib.dump(model, model_path, compress=3)
     model_file = JoblibSerializedFile(model_path)
     return model_file
 
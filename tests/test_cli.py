@@ -13,3 +13,592 @@ def test_load_execution_utils():
 
     hasattr(flytezen.cli.execution_utils, "wait_for_workflow_completion")
     print(flytezen.cli.execution_utils.__file__)
+
+
+def test_wait_for_workflow_completion_backoff(monkeypatch):
+    import contextlib
+    import logging
+    from types import SimpleNamespace
+
+    from flytekit import WorkflowExecutionPhase
+
+    from flytezen.cli import execution_utils
+
+    phases = iter(
+        [
+            WorkflowExecutionPhase.QUEUED,
+            WorkflowExecutionPhase.RUNNING,
+            WorkflowExecutionPhase.RUNNING,
+            WorkflowExecutionPhase.RUNNING,
+            WorkflowExecutionPhase.SUCCEEDED,
+        ]
+    )
+
+    class FakeClient:
+        def get_execution(self, execution_id):
+            return SimpleNamespace(closure=SimpleNamespace(phase=next(phases)))
+
+    class FakeRemote:
+        client = FakeClient()
+        synced = 0
+
+        def sync(self, execution):
+            self.synced += 1
+            return SimpleNamespace(
+                closure=SimpleNamespace(
+                    phase=WorkflowExecutionPhase.SUCCEEDED, error=None
+                ),
+            )
+
+    sleeps = []
+
+    class FakeEvent:
+        def wait(self, timeout):
+            sleeps.append(timeout)
+            return False
+
+    @contextlib.contextmanager
+    def fake_sigint_event():
+        yield FakeEvent()
+
+    monkeypatch.setattr(execution_utils, "sigint_event", fake_sigint_event)
+    monkeypatch.setenv("FLYTE_POLL_INITIAL_SEC", "2")
+    monkeypatch.delenv("FLYTE_POLL_MAX_SEC", raising=False)
+
+    remote = FakeRemote()
+    execution_utils.wait_for_workflow_completion(
+        SimpleNamespace(id=None),
+        remote,
+        logging.getLogger("test"),
+        poll_jitter=0.0,
+    )
+
+    assert sleeps == [2.0, 2.0, 3.0, 4.5]
+    assert remote.synced == 1
+
+    # a poll_max below the initial interval is raised to it
+    phases = iter(
+        [
+            WorkflowExecutionPhase.RUNNING,
+            WorkflowExecutionPhase.RUNNING,
+            WorkflowExecutionPhase.SUCCEEDED,
+        ]
+    )
+    sleeps.clear()
+    monkeypatch.setenv("FLYTE_POLL_MAX_SEC", "1")
+    execution_utils.wait_for_workflow_completion(
+        SimpleNamespace(id=None),
+        remote,
+        logging.getLogger("test"),
+        poll_jitter=0.0,
+    )
+    assert sleeps == [2.0, 2.0]
+
+
+def test_sigint_event_second_interrupt_raises():
+    import signal
+
+    import pytest
+
+    from flytezen.cli import execution_utils
+
+    previous_handler = signal.getsignal(signal.SIGINT)
+    with execution_utils.sigint_event() as interrupted:
+        signal.raise_signal(signal.SIGINT)
+        assert interrupted.is_set()
+        with pytest.raises(KeyboardInterrupt):
+            signal.raise_signal(signal.SIGINT)
+    assert signal.getsignal(signal.SIGINT) is previous_handler
+
+
+def test_sigint_event_wait_wakes_on_signal():
+    import os
+    import signal
+    import threading
+    import time
+
+    from flytezen.cli import execution_utils
+
+    previous_wakeup_fd = signal.set_wakeup_fd(-1)
+    signal.set_wakeup_fd(previous_wakeup_fd)
+
+    with execution_utils.sigint_event() as interrupted:
+        start = time.monotonic()
+        assert not interrupted.wait(0.05)
+        assert time.monotonic() - start >= 0.05
+
+        # a SIGINT sent while the main thread is blocked in wait wakes it
+        # long before the timeout
+        sender = threading.Timer(
+            0.05, os.kill, args=(os.getpid(), signal.SIGINT)
+        )
+        sender.start()
+        start = time.monotonic()
+        assert interrupted.wait(30)
+        assert time.monotonic() - start < 10
+        sender.join()
+
+    assert signal.set_wakeup_fd(previous_wakeup_fd) == previous_wakeup_fd
+
+
+def test_wait_for_workflow_completion_interrupt_terminates(monkeypatch):
+    import contextlib
+    import logging
+    from types import SimpleNamespace
+
+    import pytest
+    from flytekit import WorkflowExecutionPhase
+
+    from flytezen.cli import execution_utils
+
+    class FakeClient:
+        def get_execution(self, execution_id):
+            return SimpleNamespace(
+                closure=SimpleNamespace(phase=WorkflowExecutionPhase.RUNNING)
+            )
+
+    class FakeRemote:
+        client = FakeClient()
+
+        def __init__(self):
+            self.terminated = []
+
+        def terminate(self, execution, cause):
+            self.terminated.append(cause)
+
+    class FakeEvent:
+        def wait(self, timeout):
+            return True
+
+    @contextlib.contextmanager
+    def fake_sigint_event():
+        yield FakeEvent()
+
+    monkeypatch.setattr(execution_utils, "sigint_event", fake_sigint_event)
+    monkeypatch.setattr(
+        execution_utils, "prompt_with_timeout", lambda prompt, timeout: "y"
+    )
+
+    remote = FakeRemote()
+    with pytest.raises(SystemExit):
+        execution_utils.wait_for_workflow_completion(
+            SimpleNamespace(id=None),
+            remote,
+            logging.getLogger("test"),
+            poll_interval=1.0,
+            poll_max=1.0,
+        )
+
+    assert remote.terminated == ["KeyboardInterrupt confirmed termination"]
+
+
+def test_git_version_cache_round_trip(tmp_path, monkeypatch):
+    from flytezen.cli import execution_utils
+
+    monkeypatch.setattr(
+        execution_utils, "GIT_VERSION_CACHE_DIR", str(tmp_path / "cache")
+    )
+    git_dir = str(tmp_path / ".git")
+    git_info = ("flytezen", "main", "abc1234")
+
+    assert execution_utils.read_git_version_cache("key1", git_dir) is None
+    execution_utils.write_git_version_cache("key1", git_info, git_dir)
+    assert execution_utils.read_git_version_cache("key1", git_dir) == git_info
+    assert execution_utils.read_git_version_cache("key2", git_dir) is None
+
+    # a new key replaces the repository's entry instead of adding one
+    execution_utils.write_git_version_cache(
+        "key2", ("flytezen", "dev", "def5678"), git_dir
+    )
+    assert execution_utils.read_git_version_cache("key1", git_dir) is None
+    assert execution_utils.read_git_version_cache("key2", git_dir) == (
+        "flytezen",
+        "dev",
+        "def5678",
+    )
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+def test_git_version_cache_write_is_atomic(tmp_path, monkeypatch):
+    import os
+
+    from flytezen.cli import execution_utils
+
+    monkeypatch.setattr(
+        execution_utils, "GIT_VERSION_CACHE_DIR", str(tmp_path / "cache")
+    )
+    git_dir = str(tmp_path / ".git")
+    cache_path = execution_utils.git_version_cache_path(git_dir)
+    execution_utils.write_git_version_cache(
+        "key1", ("flytezen", "main", "abc1234"), git_dir
+    )
+
+    replaced = []
+    real_replace = os.replace
+
+    def checked_replace(src, dst):
+        # the new entry is complete before it is moved into place, and the
+        # previous entry stays readable until then
+        with open(src) as tmp_file:
+            assert tmp_file.read() == "key2\nflytezen\ndev\ndef5678\n"
+        assert execution_utils.read_git_version_cache("key1", git_dir)
+        replaced.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", checked_replace)
+    execution_utils.write_git_version_cache(
+        "key2", ("flytezen", "dev", "def5678"), git_dir
+    )
+    assert replaced == [cache_path]
+    assert os.listdir(tmp_path / "cache") == [os.path.basename(cache_path)]
+
+    def failing_replace(src, dst):
+        raise PermissionError
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    execution_utils.write_git_version_cache(
+        "key3", ("flytezen", "main", "0123456"), git_dir
+    )
+    assert os.listdir(tmp_path / "cache") == [os.path.basename(cache_path)]
+    assert execution_utils.read_git_version_cache("key2", git_dir) == (
+        "flytezen",
+        "dev",
+        "def5678",
+    )
+
+
+def test_read_loose_head(tmp_path):
+    from flytezen.cli.execution_utils import read_loose_head
+
+    sha = b"0123456789abcdef0123456789abcdef01234567"
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads" / "feature").mkdir(parents=True)
+
+    # symbolic HEAD pointing to a loose branch ref
+    (git_dir / "HEAD").write_bytes(b"ref: refs/heads/feature/x\n")
+    (git_dir / "refs" / "heads" / "feature" / "x").write_bytes(sha + b"\n")
+    assert read_loose_head(str(git_dir)) == ("feature/x", sha)
+
+    # detached HEAD
+    (git_dir / "HEAD").write_bytes(sha + b"\n")
+    assert read_loose_head(str(git_dir)) is None
+
+    # branch ref only present in packed-refs
+    (git_dir / "HEAD").write_bytes(b"ref: refs/heads/main\n")
+    (git_dir / "packed-refs").write_bytes(sha + b" refs/heads/main\n")
+    assert read_loose_head(str(git_dir)) is None
+
+    # malformed loose ref
+    (git_dir / "refs" / "heads" / "main").write_bytes(b"not a sha\n")
+    assert read_loose_head(str(git_dir)) is None
+
+
+def test_log_execution_config_branches(monkeypatch, caplog, capsys):
+    import logging
+    from types import SimpleNamespace
+
+    from omegaconf import OmegaConf
+
+    from flytezen.cli import execute
+
+    zen_cfg = OmegaConf.create({"entity_config": {"module_name": "lrwine"}})
+
+    def log_config(interactive, level, pretty=False):
+        monkeypatch.setattr(
+            execute.sys, "stdout", SimpleNamespace(isatty=lambda: interactive)
+        )
+        if pretty:
+            monkeypatch.setenv("FLYTEZEN_PRETTY", "1")
+        else:
+            monkeypatch.delenv("FLYTEZEN_PRETTY", raising=False)
+        printed = []
+        monkeypatch.setattr("rich.print", printed.append)
+        caplog.clear()
+        caplog.set_level(level, logger=execute.logger.name)
+        execute.log_execution_config(zen_cfg)
+        return [(r.levelno, r.getMessage()) for r in caplog.records], printed
+
+    # non-interactive runs only log the config at DEBUG
+    assert log_config(False, logging.INFO) == ([], [])
+    records, printed = log_config(False, logging.DEBUG)
+    assert [level for level, _ in records] == [logging.DEBUG]
+    assert "module_name: lrwine" in records[0][1]
+    assert printed == []
+
+    # interactive runs log it at INFO and render the tree at DEBUG
+    records, printed = log_config(True, logging.INFO)
+    assert [level for level, _ in records] == [logging.INFO]
+    assert printed == []
+    records, printed = log_config(True, logging.DEBUG)
+    assert records == []
+    assert [tree.label for tree in printed] == ["execute_workflow"]
+
+    # FLYTEZEN_PRETTY renders the tree at INFO, also off a TTY
+    records, printed = log_config(False, logging.INFO, pretty=True)
+    assert records == []
+    assert [tree.label for tree in printed] == ["execute_workflow"]
+    assert log_config(False, logging.WARNING, pretty=True) == ([], [])
+
+
+def test_env_float_rejects_invalid_poll_intervals(monkeypatch):
+    import logging
+
+    from flytezen.cli.execution_utils import env_float
+
+    logger = logging.getLogger("test")
+    for value in ["0", "-1", "nan", "inf", "-inf", "soon"]:
+        monkeypatch.setenv("FLYTE_POLL_INITIAL_SEC", value)
+        assert env_float("FLYTE_POLL_INITIAL_SEC", 3.0, logger) == 3.0
+    monkeypatch.setenv("FLYTE_POLL_INITIAL_SEC", "0.5")
+    assert env_float("FLYTE_POLL_INITIAL_SEC", 3.0, logger) == 0.5
+
+
+def test_fast_package_streaming_matches_flytekit(tmp_path):
+    import os
+
+    from flytekit.tools.fast_registration import fast_package
+
+    from flytezen.cli.execute import fast_package_streaming
+
+    source = tmp_path / "source"
+    (source / "pkg" / "sub").mkdir(parents=True)
+    (source / "pkg" / "__init__.py").write_text("")
+    (source / "pkg" / "sub" / "module.py").write_text("x = 1\n" * 1000)
+    (source / "pkg" / "data.bin").write_bytes(os.urandom(70000))
+    (source / "pkg" / "__pycache__").mkdir()
+    (source / "pkg" / "__pycache__" / "module.pyc").write_bytes(b"\0")
+    (source / "link.py").symlink_to(source / "pkg" / "sub" / "module.py")
+    (tmp_path / "flytekit").mkdir()
+    (tmp_path / "streaming").mkdir()
+
+    expected = fast_package(source, tmp_path / "flytekit", deref_symlinks=True)
+    actual = fast_package_streaming(str(source), str(tmp_path / "streaming"))
+
+    assert actual.name == os.path.basename(expected)
+    assert (
+        actual.read_bytes()
+        == (tmp_path / "flytekit" / actual.name).read_bytes()
+    )
+
+
+def test_process_data_binarizes_target():
+    import pandas as pd
+
+    from flytezen.workflows.lrwine import process_data
+
+    data = pd.DataFrame(
+        {"alcohol": [13.0, 14.0, 12.5, 12.0], "target": [0, 1, 2, 0]}
+    )
+    original = data.copy()
+
+    processed = process_data.task_function(data)
+
+    expected = data.assign(
+        target=lambda x: x["target"].where(x["target"] == 0, 1)
+    )
+    pd.testing.assert_frame_equal(processed, expected)
+    pd.testing.assert_frame_equal(data, original)
+
+
+def test_infer_type_from_default_json_matches_isinstance_chain():
+    import enum
+    from collections import OrderedDict
+
+    import numpy as np
+    import pytest
+
+    from flytezen.configuration import (
+        TypeInferenceError,
+        infer_type_from_default_json,
+    )
+
+    class Color(enum.IntEnum):
+        RED = 1
+
+    class Name(str):
+        pass
+
+    # equal defaults such as True, 1 and Color.RED cannot share a dict
+    cases = [
+        (True, bool),
+        (0, int),
+        (Color.RED, int),
+        (1.5, float),
+        (np.float64(2.0), float),
+        ("l2", str),
+        (Name("lbfgs"), str),
+        ([1], list),
+        ({"a": 1}, dict),
+        (OrderedDict(a=1), dict),
+        ((), None),
+        (np.int64(3), None),
+    ]
+    for default, expected in cases:
+        if expected is None:
+            with pytest.raises(TypeInferenceError):
+                infer_type_from_default_json(default, "param")
+        else:
+            assert infer_type_from_default_json(default, "param") is expected
+
+
+def test_prompt_with_timeout(monkeypatch):
+    import io
+    import os
+
+    from flytezen.cli.execution_utils import prompt_with_timeout
+
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd) as stdin, os.fdopen(write_fd, "w") as writer:
+        monkeypatch.setattr("sys.stdin", stdin)
+        # nothing typed before the timeout
+        assert prompt_with_timeout("Terminate? ", 0.01) == "n"
+        writer.write("y\n")
+        writer.flush()
+        assert prompt_with_timeout("Terminate? ", 1) == "y\n"
+
+    # stdin without a file descriptor is read in a thread
+    monkeypatch.setattr("sys.stdin", io.StringIO("yes\n"))
+    assert prompt_with_timeout("Terminate? ", 1) == "yes"
+
+
+def test_upload_fast_package_falls_back_to_tempdir(tmp_path, monkeypatch):
+    import errno
+    import os
+    import tempfile
+
+    from flytezen.cli import execute
+
+    shm_dir = tmp_path / "shm"
+    shm_dir.mkdir()
+    fallback_dir = tmp_path / "tmp"
+    fallback_dir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(fallback_dir))
+
+    real_isdir = os.path.isdir
+    monkeypatch.setattr(
+        os.path,
+        "isdir",
+        lambda path: real_isdir(shm_dir if path == "/dev/shm" else path),
+    )
+    real_temporary_directory = tempfile.TemporaryDirectory
+
+    def temporary_directory(**kwargs):
+        if kwargs.get("dir") == "/dev/shm":
+            kwargs["dir"] = str(shm_dir)
+        return real_temporary_directory(**kwargs)
+
+    monkeypatch.setattr(tempfile, "TemporaryDirectory", temporary_directory)
+
+    def fast_package_streaming(source, output_dir):
+        if output_dir.startswith(str(shm_dir)):
+            raise OSError(errno.ENOSPC, "No space left on device")
+        archive_path = execute.pathlib.Path(output_dir) / "fast.tar.gz"
+        archive_path.write_bytes(b"archive")
+        return archive_path
+
+    monkeypatch.setattr(
+        execute, "fast_package_streaming", fast_package_streaming
+    )
+
+    uploaded = []
+
+    class FakeRemote:
+        def upload_file(self, archive_path):
+            uploaded.append(
+                (archive_path.parent.parent, archive_path.read_bytes())
+            )
+            return b"md5", "s3://bucket/fast.tar.gz"
+
+    assert (
+        execute.upload_fast_package(FakeRemote(), "src")
+        == "s3://bucket/fast.tar.gz"
+    )
+    assert uploaded == [(fallback_dir, b"archive")]
+    assert list(shm_dir.iterdir()) == []
+    assert list(fallback_dir.iterdir()) == []
+
+    # without /dev/shm the default temporary directory is used directly
+    shm_dir.rmdir()
+    uploaded.clear()
+    execute.upload_fast_package(FakeRemote(), "src")
+    assert uploaded == [(fallback_dir, b"archive")]
+
+
+def test_is_builtin_type_matches_class_and_module_check():
+    import sys
+    from typing import Annotated, Optional
+
+    import pandas as pd
+    from flytekit.types.file import FlyteFile
+
+    from flytezen.cli.execution_utils import is_builtin_type
+
+    def is_builtin_class(param_type):
+        return (
+            isinstance(param_type, type) and param_type.__module__ == "builtins"
+        )
+
+    annotations = [
+        int,
+        str,
+        type(None),
+        list,
+        list[int],
+        dict[str, float],
+        tuple[int, ...],
+        Optional[int],
+        Annotated[int, []],
+        FlyteFile,
+        pd.DataFrame,
+    ]
+    for annotation in annotations:
+        assert is_builtin_type(annotation) == is_builtin_class(annotation)
+
+    if sys.version_info < (3, 11):
+        # parametrized generics are classes, and so built-in, on Python 3.10
+        assert is_builtin_type(list[int])
+
+
+def test_execution_context_rejects_busy_polling():
+    import math
+
+    import pytest
+
+    from flytezen.cli.execute import ExecutionContext
+
+    for field_name, value in [
+        ("poll_interval", 0.0),
+        ("poll_interval", -1.0),
+        ("poll_interval", math.nan),
+        ("poll_max", 0.0),
+        ("poll_max", math.inf),
+        ("poll_backoff", 0.5),
+        ("poll_backoff", math.nan),
+    ]:
+        with pytest.raises(ValueError, match=field_name):
+            ExecutionContext(**{field_name: value})
+
+    execution_context = ExecutionContext(
+        poll_interval=1.0, poll_backoff=1.0, poll_max=30.0
+    )
+    assert execution_context.poll_backoff == 1.0
+
+
+def test_callable_parameters_resolves_type_hints():
+    import sys
+    from typing import Annotated, Optional
+
+    from flytezen.configuration import callable_parameters
+
+    def f(a=None, b: Annotated[int, "meta"] = 1, c: "float" = 2.0):
+        ...
+
+    # an implicitly optional annotation, as in untyped third-party code
+    f.__annotations__["a"] = int
+    types = {name: hint for name, hint, _ in callable_parameters(f)}
+
+    # get_type_hints strips Annotated metadata and evaluates strings
+    assert types["b"] is int
+    assert types["c"] is float
+    # on Python 3.10 it also wraps None-defaulted annotations in Optional
+    assert types["a"] == (Optional[int] if sys.version_info < (3, 11) else int)